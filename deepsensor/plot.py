@@ -1,21 +1,145 @@
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import weakref
+from collections import OrderedDict
+
 import numpy as np
 
-import matplotlib.pyplot as plt
 import pandas as pd
-from mpl_toolkits.axes_grid1 import make_axes_locatable
-import matplotlib.patches as mpatches
 
 import lab as B
 
-from typing import Optional, Union, List, Tuple
+from typing import Optional, Union, List, Tuple, TYPE_CHECKING
 
+from deepsensor import backend
 from deepsensor.data.task import Task, flatten_X
 from deepsensor.data.loader import TaskLoader
 from deepsensor.data.processor import DataProcessor
 from deepsensor.model.pred import Prediction
 from pandas import DataFrame
-from matplotlib.colors import Colormap
-from matplotlib.axes import Axes
+
+if TYPE_CHECKING:
+    # matplotlib is slow to import, so it is only imported by the functions that
+    # plot, not when `deepsensor` is imported
+    import matplotlib.pyplot as plt
+    from matplotlib.colors import Colormap
+
+# Model outputs computed for plotting (e.g. the ``ConvNP`` encoding), cached so that
+# plotting the same task with several functions only runs the model once
+_model_outputs_cache: "OrderedDict[Tuple[int, str], dict]" = OrderedDict()
+_MODEL_OUTPUTS_CACHE_MAXSIZE = 4  # Entries hold every U-Net activation, so keep small
+
+
+def _hash_task(task: Task) -> Optional[str]:
+    """Hash the data in ``task`` that the encoding and U-Net activations depend on.
+
+    Tasks are identified by content rather than by ``id``, so an identical task
+    loaded again hits the cache, whereas a task modified in place does not.
+    Returns None if the task holds data that cannot be hashed by content.
+    """
+    hasher = hashlib.sha1()
+
+    def update(x) -> bool:
+        if isinstance(x, (list, tuple)):
+            hasher.update(b"[")
+            if not all(update(x_i) for x_i in x):
+                return False
+            hasher.update(b"]")
+        elif x is None:
+            hasher.update(b"None")
+        elif isinstance(x, backend.nps.Masked):
+            # Observations with NaNs masked by `ConvNP.modify_task`
+            hasher.update(b"Masked")
+            return update(x.y) and update(x.mask)
+        else:
+            arr = np.ascontiguousarray(B.to_numpy(x))
+            if arr.dtype == object:
+                # The bytes of an object array are pointers, not content
+                return False
+            hasher.update(f"{arr.dtype}{arr.shape}".encode())
+            hasher.update(arr.tobytes())
+        return True
+
+    # Target locations matter as they set the extent of the encoder's internal grid
+    for key in ("X_c", "Y_c", "X_t", "Y_t_aux"):
+        hasher.update(key.encode())
+        if not update(task.get(key)):
+            return None
+    return hasher.hexdigest()
+
+
+def _model_state(model) -> tuple:
+    """Get a cheap fingerprint of the weights of ``model``, used to invalidate
+    cached outputs when the model is trained further or new weights are loaded.
+    """
+    if backend.str == "torch":
+        # Optimiser steps and `load_state_dict` update tensors in place, which bumps
+        # their version counters, so the weights themselves need not be read
+        tensors = [*model.model.parameters(), *model.model.buffers()]
+        return id(model.model), tuple(tensor._version for tensor in tensors)
+    elif backend.str == "tf":
+        import tensorflow as tf
+
+        try:
+            weights = model.model.weights
+        except ValueError:
+            # Keras only creates weights on the first forward pass, so the model has
+            # not been trained or loaded with weights yet
+            return id(model.model), None
+        # Reduce each weight on its device and transfer the sums in one go
+        weight_sums = tf.stack([tf.reduce_sum(weight) for weight in weights])
+        return id(model.model), weight_sums.numpy().tobytes()
+    else:
+        raise NotImplementedError(f"Backend {backend.str} not supported.")
+
+
+def _cached_model_outputs(model, task: Task) -> dict:
+    """Get the dict of cached plotting outputs for a ``(model, task)`` pair.
+
+    Entries record a fingerprint of the model's weights and are discarded if it
+    has changed since, so outputs are recomputed after training. Entries are
+    dropped as soon as the model is garbage collected, so a recycled model ID can
+    never return stale outputs. The returned dict is empty on a cache miss and
+    should be populated in place. Tasks that cannot be hashed by content are not
+    cached.
+    """
+    task_hash = _hash_task(task)
+    if task_hash is None:
+        return {}
+    key = (id(model), task_hash)
+    model_state = _model_state(model)
+    entry = _model_outputs_cache.get(key)
+    if entry is not None and entry["model_state"] == model_state:
+        _model_outputs_cache.move_to_end(key)
+        return entry["outputs"]
+
+    def evict(_ref):
+        _model_outputs_cache.pop(key, None)
+
+    _model_outputs_cache[key] = {
+        "model_ref": weakref.ref(model, evict),
+        "model_state": model_state,
+        "outputs": {},
+    }
+    _model_outputs_cache.move_to_end(key)
+    if len(_model_outputs_cache) > _MODEL_OUTPUTS_CACHE_MAXSIZE:
+        _model_outputs_cache.popitem(last=False)
+    return _model_outputs_cache[key]["outputs"]
+
+
+def _compute_encoding_tensor(
+    model, task: Task, outputs: dict, refresh_cache: bool = False
+) -> np.ndarray:
+    """Compute the encoding tensor of ``task``, reusing the one in ``outputs`` (as
+    returned by :func:`_cached_model_outputs`) if possible.
+    """
+    from .model.nps import compute_encoding_tensor
+
+    if refresh_cache or "encoding" not in outputs:
+        outputs["encoding"] = compute_encoding_tensor(model, task)
+    return outputs["encoding"]
 
 
 def task(
@@ -53,6 +177,9 @@ def task(
     Returns:
         :class:`matplotlib:matplotlib.figure.Figure`:
     """
+    import matplotlib.pyplot as plt
+    from mpl_toolkits.axes_grid1 import make_axes_locatable
+
     if markersize is None:
         markersize = (2**2) * figsize / 3
 
@@ -149,6 +276,16 @@ def task(
     return fig
 
 
+# rcParams for creating axes without ticks or tick labels (e.g. for image plots), which
+# is cheaper than removing the ticks from each axes after it has been created
+_NO_TICKS_RC = {
+    "xtick.bottom": False,
+    "xtick.labelbottom": False,
+    "ytick.left": False,
+    "ytick.labelleft": False,
+}
+
+
 def context_encoding(
     model,
     task: Task,
@@ -163,6 +300,8 @@ def context_encoding(
     titles: Optional[dict] = None,
     size: int = 3,
     return_axes: bool = False,
+    use_cache: bool = True,
+    refresh_cache: bool = False,
 ):
     """Plot the ``ConvNP`` SetConv encoding of a context set in a task.
 
@@ -183,9 +322,11 @@ def context_encoding(
             Index of the land mask in the encoding (used to overlay land
             contour on plots), by default None.
         cbar (bool, optional):
-            Whether to add a colorbar to the plots, by default True.
+            Whether to add a colorbar to the plots, by default True. If
+            ``clim`` is given, a single colorbar is shared by all subplots.
         clim (tuple, optional):
-            Colorbar limits, by default None.
+            Colorbar limits, by default None (each subplot is scaled to its own
+            data range).
         cmap (str | matplotlib.colors.Colormap, optional):
             Color map to use for the plots, by default "viridis".
         verbose_titles (bool, optional):
@@ -198,6 +339,13 @@ def context_encoding(
             Size of the figure in inches, by default 3.
         return_axes (bool, optional):
             Whether to return the axes of the figure, by default False.
+        use_cache (bool, optional):
+            Whether to reuse the encoding computed by a previous plotting call
+            with the same ``model`` (and weights) and ``task`` (e.g.
+            :func:`feature_maps`), by default True.
+        refresh_cache (bool, optional):
+            Whether to recompute the encoding and overwrite any cached one, by
+            default False. Ignored if ``use_cache`` is False.
 
     Returns:
         :obj:`matplotlib.figure.Figure` | Tuple[:obj:`matplotlib.figure.Figure`, :obj:`matplotlib.pyplot.Axes`]:
@@ -206,30 +354,46 @@ def context_encoding(
             the :obj:`axes <matplotlib.axes.Axes>` of the figure (if
             ``return_axes`` was set to ``True``).
     """
-    from .model.nps import compute_encoding_tensor
+    import matplotlib.pyplot as plt
+    from mpl_toolkits.axes_grid1 import make_axes_locatable
 
-    encoding_tensor = compute_encoding_tensor(model, task)
+    outputs = _cached_model_outputs(model, task) if use_cache else {}
+    encoding_tensor = _compute_encoding_tensor(model, task, outputs, refresh_cache)
     encoding_tensor = encoding_tensor[batch_idx]
 
     if isinstance(context_set_idxs, int):
         context_set_idxs = [context_set_idxs]
     if context_set_idxs is None:
-        context_set_idxs = np.array(range(len(task_loader.context_dims)))
+        context_set_idxs = np.arange(len(task_loader.context_dims))
 
-    context_var_ID_set_sizes = [
-        ndim + 1 for ndim in np.array(task_loader.context_dims)[context_set_idxs]
-    ]  # Add density channel to each set size
-    max_context_set_size = max(context_var_ID_set_sizes)
+    context_var_ID_set_sizes = (
+        np.asarray(task_loader.context_dims)[context_set_idxs] + 1
+    )  # Add density channel to each set size
+    max_context_set_size = int(context_var_ID_set_sizes.max())
     ncols = max_context_set_size
     nrows = len(context_set_idxs)
 
     figsize = (ncols * size, nrows * size)
-    fig, axes = plt.subplots(nrows=nrows, ncols=ncols, figsize=figsize)
+    with plt.rc_context(_NO_TICKS_RC):
+        fig, axes = plt.subplots(nrows=nrows, ncols=ncols, figsize=figsize)
     if nrows == 1:
         axes = axes[np.newaxis]
 
     ctx_channel_idxs = np.cumsum(np.array(task_loader.context_dims) + 1)
 
+    if land_idx is not None:
+        import contourpy
+        from matplotlib.collections import LineCollection
+
+        # Trace the land contour once and add a copy of the lines to each subplot,
+        # rather than re-running the contouring algorithm for every subplot
+        land_contour_lines = contourpy.contour_generator(
+            z=encoding_tensor[land_idx]
+        ).lines(0.5)
+
+    # Only draw a colorbar per subplot if each subplot has its own colour scale
+    per_subplot_cbar = cbar and clim is None
+
     for row_i, ctx_i in enumerate(context_set_idxs):
         channel_i = (
             ctx_channel_idxs[ctx_i - 1] if ctx_i > 0 else 0
@@ -240,8 +404,17 @@ def context_encoding(
             var_IDs = task_loader.context_var_IDs[ctx_i]
 
         ncols_row_i = task_loader.context_dims[ctx_i] + 1  # Add density channel
-        for col_i in range(ncols_row_i):
+        # Resolve the row's subplot titles up front rather than per channel
+        if titles is not None:
+            row_titles = [titles[channel_i + col_i] for col_i in range(ncols_row_i)]
+        else:
+            row_titles = [f"Density {ctx_i}"] + [
+                f"{var_ID}" for var_ID in var_IDs[: ncols_row_i - 1]
+            ]
+        for col_i, title in enumerate(row_titles):
             ax = axes[row_i, col_i]
+            # One image per channel (rather than a single tiled mosaic) so that each
+            # subplot keeps its own axes and, when `clim` is None, its own colour scale.
             # Need `origin="lower"` because encoding has `x1` increasing from top to bottom,
             # whereas in visualisations we want `x1` increasing from bottom to top.
 
@@ -251,34 +424,19 @@ def context_encoding(
                 clim=clim,
                 cmap=cmap,
             )
-            if titles is not None:
-                ax.set_title(titles[channel_i])
-            elif col_i == 0:
-                ax.set_title(f"Density {ctx_i}")
-            elif col_i > 0:
-                ax.set_title(f"{var_IDs[col_i - 1]}")
+            ax.set_title(title)
             if col_i == 0:
                 ax.set_ylabel(f"Context set {ctx_i}")
-            if cbar:
+            if per_subplot_cbar:
                 divider = make_axes_locatable(ax)
                 cax = divider.append_axes("right", size="5%", pad=0.05)
                 plt.colorbar(im, cax)
             ax.patch.set_edgecolor("black")
             ax.patch.set_linewidth(1)
             if land_idx is not None:
-                ax.contour(
-                    encoding_tensor[land_idx],
-                    colors="k",
-                    levels=[0.5],
-                    origin="lower",
+                ax.add_collection(
+                    LineCollection(land_contour_lines, colors="k"), autolim=False
                 )
-            ax.tick_params(
-                which="both",
-                bottom=False,
-                left=False,
-                labelbottom=False,
-                labelleft=False,
-            )
             channel_i += 1
         for col_i in range(ncols_row_i, ncols):
             # Hide unused axes
@@ -286,6 +444,10 @@ def context_encoding(
             ax.axis("off")
 
     plt.tight_layout()
+    if cbar and not per_subplot_cbar:
+        # All subplots share the same colour scale, so a single colorbar suffices
+        mappable = plt.cm.ScalarMappable(norm=plt.Normalize(*clim), cmap=cmap)
+        fig.colorbar(mappable, ax=axes.ravel().tolist(), shrink=0.8)
     if not return_axes:
         return fig
     elif return_axes:
@@ -357,6 +519,7 @@ def offgrid_context(
     else:
         X = task["X_c"]
 
+    n_context = len(task["X_c"])
     for set_i, X in enumerate(X):
         if context_set_idxs is not None and set_i not in context_set_idxs:
             continue
@@ -366,31 +529,33 @@ def offgrid_context(
         if X.ndim == 3:
             X = X[0]  # select first batch
 
+        # Flip 2D coords for Cartesian fmt: x2, x1
         if data_processor is not None:
             x1, x2 = data_processor.map_x1_and_x2(X[0], X[1], unnorm=True)
-            X = np.stack([x1, x2], axis=0)
-
-        X = X[::-1]  # flip 2D coords for Cartesian fmt
+            X = np.stack([x2, x1], axis=0)
+        else:
+            X = X[::-1]
 
         label = ""
-        if plot_target and set_i < len(task["X_c"]):
+        if plot_target and set_i < n_context:
             label += f"Context set {set_i} "
             if task_loader is not None:
                 label += f"({task_loader.context_var_IDs[set_i]})"
-        elif plot_target and set_i >= len(task["X_c"]):
-            label += f"Target set {set_i - len(task['X_c'])} "
+        elif plot_target and set_i >= n_context:
+            label += f"Target set {set_i - n_context} "
             if task_loader is not None:
-                label += f"({task_loader.target_var_IDs[set_i - len(task['X_c'])]})"
-
+                label += f"({task_loader.target_var_IDs[set_i - n_context]})"
+
+        # Build the scatter kwargs once per set rather than once per axis
+        set_scatter_kwargs = dict(
+            marker=markers[set_i],
+            color=colors[set_i],
+            **scatter_kwargs,
+            facecolors=None if markers[set_i] == "x" else "none",
+            label=label,
+        )
         for ax in axes:
-            ax.scatter(
-                *X,
-                marker=markers[set_i],
-                color=colors[set_i],
-                **scatter_kwargs,
-                facecolors=None if markers[set_i] == "x" else "none",
-                label=label,
-            )
+            ax.scatter(*X, **set_scatter_kwargs)
 
     if add_legend:
         axes[0].legend(loc="best")
@@ -469,14 +634,22 @@ def offgrid_context_observations(
     assert Y_c.shape[0] == 1
     Y_c = data_processor.map_array(Y_c, var_ID, unnorm=True).ravel()
 
-    for x_c, y_c in zip(X_c.T, Y_c):
-        if extent is not None:
-            if not (
-                extent[0] <= x_c[0] <= extent[1] and extent[2] <= x_c[1] <= extent[3]
-            ):
-                continue
-        for ax in axes:
-            ax.text(*x_c[::-1], format_str.format(float(y_c)), color=color)
+    if extent is not None:
+        in_extent = (
+            (X_c[0] >= extent[0])
+            & (X_c[0] <= extent[1])
+            & (X_c[1] >= extent[2])
+            & (X_c[1] <= extent[3])
+        )
+        X_c = X_c[:, in_extent]
+        Y_c = Y_c[in_extent]
+
+    # Convert to Python floats in bulk rather than boxing NumPy scalars per point
+    labels = [format_str.format(y_c) for y_c in Y_c.tolist()]
+    coords = X_c[::-1].T.tolist()  # Cartesian fmt: x2, x1
+    for ax in axes:
+        for (x2, x1), label in zip(coords, labels):
+            ax.text(x2, x1, label, color=color)
 
 
 def receptive_field(
@@ -501,6 +674,9 @@ def receptive_field(
     Returns:
         None.
     """
+    import matplotlib.pyplot as plt
+    import matplotlib.patches as mpatches
+
     fig, ax = plt.subplots(subplot_kw=dict(projection=crs))
 
     if isinstance(extent, str):
@@ -554,6 +730,8 @@ def feature_maps(
     figsize: int = 3,
     add_colorbar: bool = False,
     cmap: Union[str, Colormap] = "Greys",
+    use_cache: bool = True,
+    refresh_cache: bool = False,
 ) -> plt.Figure:
     """Plot the feature maps of a ``ConvNP`` model's decoder layers after a
     forward pass with a ``Task``.
@@ -573,6 +751,14 @@ def feature_maps(
             ..., by default False.
         cmap (str | matplotlib.colors.Colormap, optional):
             ..., by default "Greys".
+        use_cache (bool, optional):
+            Whether to reuse the encoding and feature maps computed by a
+            previous plotting call with the same ``model`` (and weights) and
+            ``task``, by default True.
+        refresh_cache (bool, optional):
+            Whether to recompute the encoding and feature maps and overwrite
+            any cached ones (e.g. after further training), by default False.
+            Ignored if ``use_cache`` is False.
 
     Returns:
         matplotlib.figure.Figure:
@@ -582,88 +768,99 @@ def feature_maps(
         ValueError:
             If the backend is not recognised.
     """
-    from .model.nps import compute_encoding_tensor
+    import matplotlib.pyplot as plt
 
     import deepsensor
 
     # Hacky way to load the correct __init__.py to get `convert_to_tensor` method
     if deepsensor.backend.str == "tf":
         import deepsensor.tensorflow as deepsensor
+
+        # TensorFlow only records gradients inside a `tf.GradientTape`
+        no_grad = contextlib.nullcontext
     elif deepsensor.backend.str == "torch":
         import deepsensor.torch as deepsensor
+        import torch
+
+        no_grad = torch.no_grad
     else:
         raise ValueError(f"Unknown backend: {deepsensor.backend.str}")
 
     unet = model.model.decoder[0]
 
-    # Produce encoding
-    x = deepsensor.convert_to_tensor(compute_encoding_tensor(model, task))
-
     # Manually construct the U-Net forward pass from
-    # `neuralprocesses.construct_convgnp` to get the feature maps
+    # `neuralprocesses.construct_convgnp` to get the feature maps. This runs eagerly:
+    # compiling it (`torch.compile`/`tf.function`) would retrace for every layer and
+    # cost far more than the single forward pass it would speed up.
     def unet_forward(unet, x):
+        # Each feature map is copied to numpy as soon as it is computed, so the
+        # device only holds the current activation (and the skip connection being
+        # consumed) rather than every activation in the U-Net. The down-path copies
+        # double as the skip connections, which are only moved back to the device
+        # when the up path needs them.
         feature_maps = []
 
         h = unet.activations[0](unet.before_turn_layers[0](x))
-        hs = [h]
-        feature_map = B.to_numpy(h)
-        feature_maps.append(feature_map)
+        feature_maps.append(B.to_numpy(h))
         for layer, activation in zip(
             unet.before_turn_layers[1:],
             unet.activations[1:],
         ):
-            h = activation(layer(hs[-1]))
-            hs.append(h)
-            feature_map = B.to_numpy(h)
-            feature_maps.append(feature_map)
+            h = activation(layer(h))
+            feature_maps.append(B.to_numpy(h))
+        skips = feature_maps[:-1]
 
         # Now make the turn!
 
-        h = unet.activations[-1](unet.after_turn_layers[-1](hs[-1]))
-        feature_map = B.to_numpy(h)
-        feature_maps.append(feature_map)
-        for h_prev, layer, activation in zip(
-            reversed(hs[:-1]),
+        h = unet.activations[-1](unet.after_turn_layers[-1](h))
+        feature_maps.append(B.to_numpy(h))
+        for skip, layer, activation in zip(
+            reversed(skips),
             reversed(unet.after_turn_layers[:-1]),
             reversed(unet.activations[:-1]),
         ):
+            h_prev = deepsensor.convert_to_tensor(skip)
             h = activation(layer(B.concat(h_prev, h, axis=1)))
-            feature_map = B.to_numpy(h)
-            feature_maps.append(feature_map)
+            feature_maps.append(B.to_numpy(h))
 
         h = unet.final_linear(h)
-        feature_map = B.to_numpy(h)
-        feature_maps.append(feature_map)
+        feature_maps.append(B.to_numpy(h))
 
         return feature_maps
 
-    feature_maps = unet_forward(unet, x)
+    outputs = _cached_model_outputs(model, task) if use_cache else {}
+    if refresh_cache or "feature_maps" not in outputs:
+        # Produce encoding
+        x = deepsensor.convert_to_tensor(
+            _compute_encoding_tensor(model, task, outputs, refresh_cache)
+        )
+        with no_grad():
+            outputs["feature_maps"] = unet_forward(unet, x)
+    feature_maps = outputs["feature_maps"]
 
     figs = []
     rng = np.random.default_rng(seed)
     for layer_i, feature_map in enumerate(feature_maps):
         n_features = feature_map.shape[1]
         n_features_to_plot = min(n_features_per_layer, n_features)
-        feature_idxs = rng.choice(n_features, n_features_to_plot, replace=False)
+        if n_features_to_plot == 1:
+            # Avoid `choice` permuting all features to draw a single one
+            feature_idxs = [rng.integers(n_features)]
+        else:
+            feature_idxs = rng.choice(n_features, n_features_to_plot, replace=False)
 
-        fig, axes = plt.subplots(
-            nrows=1,
-            ncols=n_features_to_plot,
-            figsize=(figsize * n_features_to_plot, figsize),
-        )
+        with plt.rc_context(_NO_TICKS_RC):
+            fig, axes = plt.subplots(
+                nrows=1,
+                ncols=n_features_to_plot,
+                figsize=(figsize * n_features_to_plot, figsize),
+            )
         if n_features_to_plot == 1:
             axes = [axes]
         for f_i, ax in zip(feature_idxs, axes):
             fm = feature_map[0, f_i]
             im = ax.imshow(fm, origin="lower", cmap=cmap)
             ax.set_title(f"Feature {f_i}", fontsize=figsize * 15 / 4)
-            ax.tick_params(
-                which="both",
-                bottom=False,
-                left=False,
-                labelbottom=False,
-                labelleft=False,
-            )
             if add_colorbar:
                 cbar = ax.figure.colorbar(im, ax=ax, format="%.2f")
 
@@ -709,6 +906,8 @@ def placements(
         :class:`matplotlib:matplotlib.figure.Figure`
             A figure containing the placement plots.
     """
+    import matplotlib.pyplot as plt
+
     fig, ax = plt.subplots(subplot_kw={"projection": crs}, figsize=(figsize, figsize))
     ax.scatter(*X_new_df.values.T[::-1], c="r", linewidths=0.5, **scatter_kwargs)
     offgrid_context(ax, task, data_processor, linewidths=0.5, **scatter_kwargs)
@@ -772,6 +971,8 @@ def acquisition_fn(
             If the number of columns in the acquisition function dataset is
             greater than ``max_ncol``.
     """
+    import matplotlib.pyplot as plt
+
     # Remove spatial dims using data_processor.raw_spatial_coords_names
     plot_dims = [col_dim, *data_processor.raw_spatial_coord_names]
     non_plot_dims = [dim for dim in acquisition_fn_ds.dims if dim not in plot_dims]
@@ -813,10 +1014,23 @@ def acquisition_fn(
     else:
         axes = axes.ravel()
     if add_colorbar:
-        min, max = acquisition_fn_ds.min(), acquisition_fn_ds.max()
+        # Reduce the underlying array directly to avoid xarray's per-call overhead
+        acquisition_fn_arr = acquisition_fn_ds.values
+        vmin, vmax = np.nanmin(acquisition_fn_arr), np.nanmax(acquisition_fn_arr)
     else:
         # Use different colour scales for each plot
-        min, max = None, None
+        vmin, vmax = None, None
+
+    # Convert the placements to an array once (in Cartesian fmt: x2, x1) and slice
+    # it per plot, rather than re-indexing the DataFrame for every plot
+    X_new = X_new_df.values[:, ::-1]
+    new_iterations = X_new_df.index.values
+    if col_dim != "iteration":
+        # Assumed plotting single iteration
+        iter = acquisition_fn_ds.iteration.values
+        assert iter.size == 1, "Expected single iteration"
+        n_new = np.searchsorted(new_iterations, iter.item(), side="right")
+
     for i, col_val in enumerate(col_vals):
         ax = axes[i]
         if i == len(col_vals) - 1:
@@ -824,7 +1038,7 @@ def acquisition_fn(
         else:
             final_axis = False
         acquisition_fn_ds.sel(**{col_dim: col_val}).plot(
-            ax=ax, cmap=cmap, vmin=min, vmax=max, add_colorbar=False
+            ax=ax, cmap=cmap, vmin=vmin, vmax=vmax, add_colorbar=False
         )
         if add_colorbar and final_axis:
             im = ax.get_children()[0]
@@ -836,14 +1050,10 @@ def acquisition_fn(
         ax.set_title(f"{col_dim}={col_val}")
         ax.coastlines()
         if col_dim == "iteration":
-            X_new_df_plot = X_new_df.loc[slice(0, col_val)].values.T[::-1]
-        else:
-            # Assumed plotting single iteration
-            iter = acquisition_fn_ds.iteration.values
-            assert iter.size == 1, "Expected single iteration"
-            X_new_df_plot = X_new_df.loc[slice(0, iter.item())].values.T[::-1]
+            # Placements up to and including this iteration
+            n_new = np.searchsorted(new_iterations, col_val, side="right")
         ax.scatter(
-            *X_new_df_plot,
+            *X_new[:n_new].T,
             c="r",
             linewidths=0.5,
         )
@@ -900,6 +1110,8 @@ def prediction(
             setting of extent).
         c
     """
+    import matplotlib.pyplot as plt
+
     if pred.mode == "off-grid":
         assert date is None, "Cannot pass a `date` for off-grid predictions"
         assert (
@@ -7,6 +7,7 @@ import deepsensor.tensorflow as deepsensor
 
 from deepsensor.data.processor import DataProcessor
 from deepsensor.data.loader import TaskLoader
+from deepsensor.data.task import Task
 from deepsensor.model.convnp import ConvNP
 
 
@@ -30,13 +31,116 @@ class TestPlotting(unittest.TestCase):
         cls.task = cls.task_loader(
             "2014-12-31", context_sampling=10, target_sampling="all"
         )
+        # Create the model's weights up front (Keras builds them on the first call),
+        # so that its plotting cache entries are not invalidated by the first plot
+        cls.model(cls.task)
 
     def test_context_encoding(self):
         fig = deepsensor.plot.context_encoding(self.model, self.task, self.task_loader)
 
+    def test_context_encoding_land_contour(self):
+        """Land contour lines are added to every plotted subplot."""
+        fig, axes = deepsensor.plot.context_encoding(
+            self.model, self.task, self.task_loader, land_idx=0, return_axes=True
+        )
+        self.assertTrue(all(len(ax.collections) == 1 for ax in axes[0]))
+
+    def test_context_encoding_shared_cbar(self):
+        """A fixed ``clim`` gives one colorbar shared by all subplots."""
+        fig, axes = deepsensor.plot.context_encoding(
+            self.model, self.task, self.task_loader, clim=(0, 1), return_axes=True
+        )
+        # One colorbar axis added on top of the subplot grid
+        self.assertEqual(len(fig.axes), axes.size + 1)
+
     def test_feature_maps(self):
         figs = deepsensor.plot.feature_maps(self.model, self.task)
 
+    def test_encoding_cached_across_plots(self):
+        """Encoding computed by one plotting function is reused by another."""
+        fig = deepsensor.plot.context_encoding(self.model, self.task, self.task_loader)
+        outputs = deepsensor.plot._cached_model_outputs(self.model, self.task)
+        encoding = outputs["encoding"]
+        figs = deepsensor.plot.feature_maps(self.model, self.task)
+        self.assertIs(outputs["encoding"], encoding)
+        self.assertIn("feature_maps", outputs)
+
+    def test_feature_maps_cache_refresh(self):
+        """Equal tasks share cache entries, which ``refresh_cache`` overwrites."""
+        task = self.task_loader(
+            "2014-12-31", context_sampling=10, target_sampling="all", seed_override=0
+        )
+        task_copy = self.task_loader(
+            "2014-12-31", context_sampling=10, target_sampling="all", seed_override=0
+        )
+        figs = deepsensor.plot.feature_maps(self.model, task)
+        outputs = deepsensor.plot._cached_model_outputs(self.model, task_copy)
+        feature_maps = outputs["feature_maps"]
+        figs = deepsensor.plot.feature_maps(self.model, task_copy)
+        self.assertIs(outputs["feature_maps"], feature_maps)
+        figs = deepsensor.plot.feature_maps(self.model, task_copy, refresh_cache=True)
+        self.assertIsNot(outputs["feature_maps"], feature_maps)
+
+    def test_encoding_cache_invalidated_by_training(self):
+        """Updating the model's weights invalidates its cached outputs."""
+        model = ConvNP(
+            self.data_processor,
+            self.task_loader,
+            unet_channels=(5, 5, 5),
+            verbose=False,
+        )
+        model(self.task)  # Create the model's weights (Keras builds them lazily)
+        fig = deepsensor.plot.context_encoding(model, self.task, self.task_loader)
+        outputs = deepsensor.plot._cached_model_outputs(model, self.task)
+        self.assertIn("encoding", outputs)
+        weight = model.model.weights[0]
+        weight.assign(weight + 1)
+        outputs = deepsensor.plot._cached_model_outputs(model, self.task)
+        self.assertNotIn("encoding", outputs)
+
+    def test_plot_never_called_model(self):
+        """Plotting works for a model whose weights have not been built yet."""
+        model = ConvNP(
+            self.data_processor,
+            self.task_loader,
+            unet_channels=(5, 5, 5),
+            verbose=False,
+        )
+        fig = deepsensor.plot.context_encoding(model, self.task, self.task_loader)
+        figs = deepsensor.plot.feature_maps(model, self.task)
+
+    def test_context_encoding_cache_refresh(self):
+        """``refresh_cache`` overwrites the cached encoding."""
+        fig = deepsensor.plot.context_encoding(self.model, self.task, self.task_loader)
+        outputs = deepsensor.plot._cached_model_outputs(self.model, self.task)
+        encoding = outputs["encoding"]
+        fig = deepsensor.plot.context_encoding(
+            self.model, self.task, self.task_loader, refresh_cache=True
+        )
+        self.assertIsNot(outputs["encoding"], encoding)
+
+    def test_hash_task_skips_object_data(self):
+        """Object arrays would be hashed by address, so they are not cached."""
+        task = Task(
+            {
+                "X_c": [np.zeros((2, 1))],
+                "Y_c": [np.array([[object()]])],
+                "X_t": [np.zeros((2, 1))],
+            }
+        )
+        self.assertIsNone(deepsensor.plot._hash_task(task))
+
+    def test_encoding_cache_disabled(self):
+        """``use_cache=False`` does not populate the cache."""
+        task = self.task_loader(
+            "2014-12-31", context_sampling=10, target_sampling="all"
+        )
+        fig = deepsensor.plot.context_encoding(
+            self.model, task, self.task_loader, use_cache=False
+        )
+        outputs = deepsensor.plot._cached_model_outputs(self.model, task)
+        self.assertNotIn("encoding", outputs)
+
     def test_offgrid_context(self):
         pred = self.model.predict(self.task, X_t=self.ds_raw)
         fig = pred["air"]["mean"].isel(time=0).plot(cmap="seismic")